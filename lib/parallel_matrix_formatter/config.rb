@@ -1,15 +1,18 @@
-require 'singleton'
-require 'yaml'
-require 'erb'
+# frozen_string_literal: true
 
 module ParallelMatrixFormatter
   # The Config class is responsible for loading and parsing the configuration
   # for the ParallelMatrixFormatter gem from `config/parallel_matrix_formatter.yml`.
   # It provides access to various configuration settings, including suppression
   # options and update renderer configurations, and uses `Config::Parser` to
-  # process specific configuration elements.
+  # process specific configuration elements. The parsed settings are deep-frozen,
+  # so they are read-only once loaded, and cached per file until it changes.
   class Config
+    CONFIG_PATH = File.expand_path('../../config/parallel_matrix_formatter.yml', __dir__)
+
     @parsers = []
+    @cache = {}
+    @cache_lock = Mutex.new
 
     def self.register_parser(parser)
       @parsers << parser
@@ -17,20 +20,43 @@ module ParallelMatrixFormatter
 
     register_parser(ProgressColumnParser)
 
-    attr_accessor :output_suppressor, :update_renderer
+    attr_reader :output_suppressor, :update_renderer
 
     def initialize
-      raw = YAML.load_file(File.expand_path('../../config/parallel_matrix_formatter.yml', __dir__))
-      parsed = parse_config(raw)
+      parsed = self.class.load_settings(CONFIG_PATH)
 
       @output_suppressor = parsed['output_suppressor']
       @update_renderer = parsed['update_renderer']
     end
 
-    private
+    # Returns the parsed settings for `path`, reusing the previous result while
+    # the file's mtime and size are unchanged. Entries are keyed by path, so a
+    # changed file replaces its stale entry instead of adding a new one.
+    # Cache hits skip the lock; a miss re-checks under it so concurrent callers
+    # parse the file only once.
+    def self.load_settings(path)
+      stat = File.stat(path)
+      signature = [stat.mtime, stat.size]
+      cached_settings(path, signature) || @cache_lock.synchronize do
+        cached_settings(path, signature) || (@cache[path] = [signature, parse_file(path)]).last
+      end
+    end
+
+    def self.cached_settings(path, signature)
+      cached = @cache[path]
+      cached.last if cached && cached.first == signature
+    end
 
-    def parse_config(raw)
-      self.class.parse_config(raw)
+    # YAML is required lazily so the parser is only loaded on a cache miss.
+    def self.parse_file(path)
+      require 'yaml'
+      deep_freeze(parse_config(YAML.load_file(path)))
+    end
+
+    # Drops every cached entry so the next load re-reads its file, e.g. after
+    # swapping the config within the filesystem's mtime resolution in tests.
+    def self.clear_cache
+      @cache_lock.synchronize { @cache.clear }
     end
 
     def self.parse_config(raw)
@@ -38,5 +64,15 @@ module ParallelMatrixFormatter
         raw = parser.parse(raw)
       end
     end
+
+    def self.deep_freeze(value)
+      case value
+      when Hash then value.each_value { |v| deep_freeze(v) }
+      when Array then value.each { |v| deep_freeze(v) }
+      end
+      value.freeze
+    end
+
+    private_class_method :cached_settings, :parse_file, :deep_freeze
   end
 end
@@ -1,3 +1,5 @@
+# frozen_string_literal: true
+
 class ParallelMatrixFormatter::Config
   class ProgressColumnParser
     # The ProgressColumnParser module is responsible for parsing specific configuration strings
@@ -24,11 +26,13 @@ class ParallelMatrixFormatter::Config
       end
     end
 
+    # Formats that do not match FORMAT_REGEX (or are missing) fall back to a
+    # centered 10-wide column instead of failing on the nil match.
     def self.parse_progress_column_percentage(percentage)
-      match = percentage['format'].match(FORMAT_REGEX)
+      match = FORMAT_REGEX.match(percentage['format'].to_s)
       {
         value: '{v}%',
-        align: match[1] || '^',
+        align: (match && match[1]) || '^',
         width: match ? match[2].to_i : 10,
         color: percentage['color'] || 'red'
       }
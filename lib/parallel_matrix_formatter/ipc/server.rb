@@ -23,7 +23,8 @@ module ParallelMatrixFormatter
             begin
               while (message = client.gets)
                 message = begin
-                  JSON.parse(message)
+                  # Frozen parse interns the repeated keys instead of copying them per message
+                  JSON.parse(message, freeze: true)
                 rescue JSON::ParserError => e
                   {
                     error: "Invalid JSON format",
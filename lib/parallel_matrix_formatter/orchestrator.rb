@@ -1,3 +1,5 @@
+# frozen_string_literal: true
+
 require_relative 'ipc/server'
 
 module ParallelMatrixFormatter
@@ -40,14 +42,19 @@ module ParallelMatrixFormatter
       @buffered_messages = []
       @process_completion = {}
       @process_summaries = {}
-      @start_time = Time.now
+      @start_time = monotonic_now
       @summary_timeout = 30.0 # 30 seconds timeout for summary collection
+      # The IPC server handles each client on its own thread; rendering shares
+      # progress and policy state and one output stream, so it runs under a lock
+      @render_lock = Mutex.new
     end
 
     def puts(message)
       if message&.include?(DUMP_PREFIX) && @total_processes > 1
-        @buffered_messages << message
-        process_buffered_messages_if_complete
+        @render_lock.synchronize do
+          @buffered_messages << message
+          process_buffered_messages_if_complete
+        end
       else
         @output.puts(message)
       end
@@ -56,30 +63,21 @@ module ParallelMatrixFormatter
     def all_processes_complete?
       return false if @process_completion.empty?
 
-      expected_processes = (1..@total_processes).to_a
-      completed_processes = @process_completion.select { |_, complete| complete }.keys
-      expected_processes.all? { |process| completed_processes.include?(process) }
+      (1..@total_processes).all? { |process| @process_completion[process] }
     end
 
     def start
       Thread.new do
         @ipc.start do |message|
+          process_number = message && message['process_number']
+          payload = message && message['message']
           # Handle summary messages
-          if message && message['message'] && message['message']['type'] == 'summary'
-            @process_summaries[message['process_number']] = message['message']['data']
+          if payload && payload['type'] == 'summary'
+            @process_summaries[process_number] = payload['data']
             # # Check if all summaries are received and render consolidated summary
             # render_consolidated_summary if all_summaries_received? # actually, it is called in close
           else
-            # Track process completion based on progress
-            if message && message['process_number'] && message['message'] && message['message']['progress']
-              track_process_completion(message['process_number'], message['message']['progress'])
-            end
-
-            update = @renderer.update(message)
-            @output.print update #if update
-
-            # Process any buffered messages if all processes are complete
-            process_buffered_messages_if_complete
+            @render_lock.synchronize { render_update(message, process_number, payload) }
           end
         rescue IOError => e
           @output.puts "Error in IPC server: #{e.message}"
@@ -110,12 +108,26 @@ module ParallelMatrixFormatter
 
     private
 
+    def render_update(message, process_number, payload)
+      # Track process completion based on progress
+      progress = payload && payload['progress']
+      track_process_completion(process_number, progress) if process_number && progress
+
+      update = @renderer.update(message)
+      @output.print update #if update
+
+      # Process any buffered messages if all processes are complete
+      process_buffered_messages_if_complete
+    end
+
     def track_process_completion(process_number, progress)
       @process_completion[process_number] = progress >= 1.0
     end
 
+    # Runs after every progress update, so test the cheap empty buffer before
+    # scanning every process's completion flag
     def process_buffered_messages_if_complete
-      return unless all_processes_complete?
+      return if @buffered_messages.empty? || !all_processes_complete?
 
       @buffered_messages.each { |msg| @output.puts(msg) }
       @buffered_messages.clear
@@ -128,13 +140,12 @@ module ParallelMatrixFormatter
     end
 
     def all_summaries_received?
-      expected_processes = (1..@total_processes).to_a
-      expected_processes.all? { |process| @process_summaries.key?(process) }
+      (1..@total_processes).all? { |process| @process_summaries.key?(process) }
     end
 
     def wait_for_summaries
-      start_time = Time.now
-      while !all_summaries_received? && (Time.now - start_time) < @summary_timeout
+      start_time = monotonic_now
+      while !all_summaries_received? && (monotonic_now - start_time) < @summary_timeout
         sleep 0.1
       end
 
@@ -152,8 +163,7 @@ module ParallelMatrixFormatter
       total_examples = @process_summaries.values.sum { |summary| summary['total_examples'] }
       all_failed_examples = @process_summaries.values.flat_map { |summary| summary['failed_examples'] }
       total_pending = @process_summaries.values.sum { |summary| summary['pending_count'] }
-      total_process_time = @process_summaries.values.sum { |summary| summary['duration'] }
-      wall_clock_time = Time.now - @start_time
+      wall_clock_time = monotonic_now - @start_time
 
       @output.puts "\n\n"
 
@@ -174,7 +184,6 @@ module ParallelMatrixFormatter
       failure_count = all_failed_examples.length
       @output.puts format_summary_line(total_examples, failure_count, total_pending)
       @output.puts "Finished in #{format_duration(wall_clock_time)} "
-      # @output.puts "(files took #{format_duration(total_process_time)} to load)"
     end
 
     def format_summary_line(total, failures, pending)
@@ -184,6 +193,12 @@ module ParallelMatrixFormatter
       parts.join(', ')
     end
 
+    # Elapsed-time measurements use the monotonic clock so NTP adjustments
+    # cannot stretch or shrink the summary timeout and reported duration.
+    def monotonic_now
+      Process.clock_gettime(Process::CLOCK_MONOTONIC)
+    end
+
     def format_duration(seconds)
       if seconds < 60
         "#{seconds.round(2)} seconds"
@@ -10,24 +10,30 @@ module ParallelMatrixFormatter
     # mechanism for Rails deprecation warnings.
     class Suppressor
       @@suppressed = false
+      LOCK = Mutex.new
 
       def initialize(config)
         @config = config
       end
 
+      # Installs the null output at most once per process. The sentinel is
+      # re-checked under the lock so formatters built concurrently cannot both
+      # install it (the second would record the NullIO as the "original" stdout).
       def suppress
-        return if @@suppressed
+        return if @@suppressed || !@config["suppress"]
 
-        return unless @config["suppress"]
+        LOCK.synchronize do
+          return if @@suppressed
 
-        @original_stdout = $stdout
-        $stdout = Output::NullIO.new
-        # TODO: this is a specific case for RSpec, consider making it more generic,
-        # maybe move to a more generic suppressor or make it configurable. Also,
-        # need to ensure that RSpec is defined and loaded.
-        RSpec::Support.warning_notifier = -> w { }
+          @original_stdout = $stdout
+          $stdout = Output::NullIO.new
+          # TODO: this is a specific case for RSpec, consider making it more generic,
+          # maybe move to a more generic suppressor or make it configurable. Also,
+          # need to ensure that RSpec is defined and loaded.
+          RSpec::Support.warning_notifier = -> w { }
 
-        @@suppressed = true
+          @@suppressed = true
+        end
       end
 
       def restore
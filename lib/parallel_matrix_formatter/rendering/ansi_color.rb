@@ -1,3 +1,5 @@
+# frozen_string_literal: true
+
 module ParallelMatrixFormatter
   module Rendering
     # The AnsiColor class provides methods for applying ANSI color codes to strings.
@@ -12,13 +14,23 @@ module ParallelMatrixFormatter
         white: "\e[37m",
         reset: "\e[0m"
       }.freeze
+      RESET = COLORS[:reset]
 
       class << self
-        COLORS.each_key do |color|
+        # Each method closes over its own escape code, so calls skip the table lookups
+        COLORS.each do |color, code|
           define_method(color) do |&block|
-            "#{COLORS[color]}#{block.call}#{COLORS[:reset]}"
+            "#{code}#{block.call}#{RESET}"
           end
         end
+
+        # Wraps `str` in the named color, or returns it untouched when the
+        # color is nil or unknown. A single table lookup replaces the
+        # `respond_to?` + `send` pair callers used to do.
+        def colorize(color, str)
+          code = COLORS[color.to_sym] if color
+          code ? "#{code}#{str}#{RESET}" : str
+        end
       end
     end
   end
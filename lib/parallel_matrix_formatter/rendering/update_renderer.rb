@@ -1,3 +1,5 @@
+# frozen_string_literal: true
+
 # This class orchestrates the rendering of real-time updates during test execution.
 # It combines progress information and individual test example statuses into a coherent output,
 # leveraging `ProgressUpdater` and `StatusRenderer` for specialized rendering tasks.
@@ -17,10 +19,7 @@ module ParallelMatrixFormatter
           @progress[message['process_number']] = message['message']['progress']
         end
 
-        str = ""
-        str += @progress_updater.update
-        str += @status_renderer.render(message)
-        str
+        "#{@progress_updater.update}#{@status_renderer.render(message)}"
       end
     end
   end
@@ -1,16 +1,25 @@
+# frozen_string_literal: true
+
 # This module provides helper methods for formatting and customizing output strings.
 # It includes functionality for digit customization based on provided configuration.
 module ParallelMatrixFormatter
   module Rendering
     module FormatHelper
+      DIGITS = '0123456789'
+
+      # `String#tr` source/target pairs for digit symbol strings, built once per
+      # distinct configured string and shared by every renderer. Only the first
+      # ten symbols are used; `\`, `-` and `^` are escaped so tr treats them literally.
+      DIGIT_TABLES = Hash.new do |tables, symbols|
+        digits = symbols.each_char.first(10)
+        tables[symbols] = [DIGITS[0, digits.size], digits.join.gsub(/[\\^-]/) { |c| "\\#{c}" }].freeze
+      end
+
       def customize_digits(str, digits_config)
         return str unless digits_config && !digits_config['symbols'].nil? && !digits_config['symbols'].empty?
 
-        digits = digits_config['symbols'].split('')[0..9]
-        (0..9).each do |i|
-          str = str.gsub(i.to_s, digits[i]) if digits[i]
-        end
-        str
+        from, to = DIGIT_TABLES[digits_config['symbols']]
+        str.tr(from, to)
       end
     end
   end
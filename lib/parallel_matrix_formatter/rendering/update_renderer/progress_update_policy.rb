@@ -5,13 +5,15 @@ module ParallelMatrixFormatter
     class UpdateRenderer
       class ProgressUpdatePolicy
         def initialize(config)
-          @config = config
+          @update_always = config['update_always']
+          @interval = config['update_interval_seconds'].to_i
+          @percentage_threshold = config['update_percentage_threshold'].to_f
           @previous_progress_update_at = nil
           @previous_progress_update = {}
         end
 
         def should_update?(progress)
-          return true if @config['update_always']
+          return true if @update_always
 
           return time_based_update?(progress) if time_update_configured?
 
@@ -21,24 +23,24 @@ module ParallelMatrixFormatter
         private
 
         def time_update_configured?
-          @config['update_interval_seconds'].to_i > 0
+          @interval > 0
         end
 
         def percentage_update_configured?
-          0 < @config['update_percentage_threshold'].to_f && @config['update_percentage_threshold'].to_f <= 100.0
+          0 < @percentage_threshold && @percentage_threshold <= 100.0
         end
 
         def time_based_update?(progress)
-          interval = @config['update_interval_seconds'].to_i
-          time_ok = @previous_progress_update_at.nil? || Time.now - @previous_progress_update_at > interval
+          now = Time.now
+          time_ok = @previous_progress_update_at.nil? || now - @previous_progress_update_at > @interval
           all_complete = !progress.empty? && progress.values.all? { |v| v >= 1.0 }
           result = (time_ok || all_complete) && !progress.empty?
-          @previous_progress_update_at = Time.now if result
+          @previous_progress_update_at = now if result
           result
         end
 
         def percentage_based_update?(progress)
-          threshold = @config['update_percentage_threshold'].to_f / 100.0
+          threshold = @percentage_threshold / 100.0
           progress.any? do |process, prgrss|
             should_update = threshold_reached?(process, prgrss, threshold)
             @previous_progress_update[process] = prgrss if should_update
@@ -1,3 +1,5 @@
+# frozen_string_literal: true
+
 # This class is responsible for updating and formatting the progress line displayed in the console.
 # It calculates the progress based on test execution, applies formatting rules,
 # and incorporates configuration for display elements like padding and colors.
@@ -7,11 +9,16 @@ module ParallelMatrixFormatter
       class ProgressUpdater
         include ParallelMatrixFormatter::Rendering::FormatHelper
 
+        DEFAULT_COLUMN_FORMAT = { 'align' => '^', 'width' => 6, 'value' => '{v}%', 'color' => 'red' }.freeze
+        DEFAULT_LINE_FORMAT = "\nUpdate is run from process {process_number}. Progress: {progress_info} "
+
         def initialize(test_env_number, progress, config)
           @test_env_number = test_env_number
           @progress = progress
           @config = config
           @policy = ProgressUpdatePolicy.new(@config)
+          resolve_display_settings
+          resolve_column_format(@config.dig('progress_column', 'parsed') || DEFAULT_COLUMN_FORMAT)
         end
 
         def update
@@ -23,65 +30,70 @@ module ParallelMatrixFormatter
 
         private
 
-        def build_progress_info
-          cfg = @config['progress_column'] || {}
-          pad_symbol = cfg['pad_symbol'] || '='
-          pad_color = cfg['pad_color']
-          @progress.sort.map { |k, v| format_progress_column(v, pad_symbol, pad_color) }
-            .then { |arr| color_progress_info(arr) }
-            .join
+        # Colors, digits and pad characters are fixed for the lifetime of the run,
+        # resolve them once; padding samples from the pad symbol's characters
+        def resolve_display_settings
+          @pad_color = @config.dig('progress_column', 'pad_color')
+          @progress_info_color = @config.dig('colors', 'progress_info')
+          @digits = @config['digits']
+          @pad_chars = (@config.dig('progress_column', 'pad_symbol') || '=').chars.freeze
         end
 
-        def format_progress_column(v, pad_symbol, pad_color)
-          format_cfg = ( @config['progress_column'] && @config['progress_column']['parsed'] ) || { 'align' => '^', 'width' => 6, 'value' => '{v}%', 'color' => 'red' }
+        # The parsed column format uses symbol keys, the default uses strings;
+        # look each setting up once here rather than for every column rendered
+        def resolve_column_format(format_cfg)
           value_template = format_cfg[:value] || format_cfg['value'] || '{v}%'
-          value = value_template.gsub('{v}', "#{(v * 100).round(0)}")
+          # Turn '{v}%' into '%<v>d%%' so each column is one Kernel#format call
+          @value_format = value_template.gsub('%', '%%').gsub('{v}', '%<v>d')
+          @width = format_cfg[:width] || format_cfg['width'] || 10
+          @align = format_cfg[:align] || format_cfg['align'] || '^'
+          @value_color = format_cfg[:color] || format_cfg['color']
+        end
+
+        def build_progress_info
+          @progress.keys.sort.map do |process|
+            column = format_progress_column(@progress[process])
+            ParallelMatrixFormatter::Rendering::AnsiColor.colorize(@progress_info_color, column)
+          end.join
+        end
+
+        def format_progress_column(v)
+          value = format(@value_format, v: (v * 100).round)
 
-          width = format_cfg[:width] || format_cfg['width'] || 10
-          align = format_cfg[:align] || format_cfg['align'] || '^'
-          pad_total = [width - value.length, 0].max
+          pad_total = [@width - value.length, 0].max
           left_pad = pad_total / 2
           right_pad = pad_total - left_pad
           lpad, rpad =
-            case align
+            case @align
             when '^' then [left_pad, right_pad]
             when '-' then [0, pad_total]
             when '+' then [pad_total, 0]
             else [left_pad, right_pad]
             end
-          # Sample from pad_symbol characters if it's a string of characters
-          pad_chars = pad_symbol.split('')
-          pad_left = lpad.times.map { pad_chars.sample }.join
-          pad_right = rpad.times.map { pad_chars.sample }.join
+          pad_left = lpad.times.map { @pad_chars.sample }.join
+          pad_right = rpad.times.map { @pad_chars.sample }.join
 
-          value = customize_digits(value, @config['digits'])
+          value = customize_digits(value, @digits)
 
           # Apply colors
-          color = format_cfg[:color] || format_cfg['color']
-          value = ParallelMatrixFormatter::Rendering::AnsiColor.send(color) { value } if color && ParallelMatrixFormatter::Rendering::AnsiColor.respond_to?(color)
-          if pad_color && ParallelMatrixFormatter::Rendering::AnsiColor.respond_to?(pad_color)
-            pad_left = ParallelMatrixFormatter::Rendering::AnsiColor.send(pad_color) { pad_left } unless pad_left.empty?
-            pad_right = ParallelMatrixFormatter::Rendering::AnsiColor.send(pad_color) { pad_right } unless pad_right.empty?
-          end
+          value = ParallelMatrixFormatter::Rendering::AnsiColor.colorize(@value_color, value)
+          pad_left = ParallelMatrixFormatter::Rendering::AnsiColor.colorize(@pad_color, pad_left) unless pad_left.empty?
+          pad_right = ParallelMatrixFormatter::Rendering::AnsiColor.colorize(@pad_color, pad_right) unless pad_right.empty?
           "#{pad_left}#{value}#{pad_right}"
         end
 
-        def color_progress_info(arr)
-          color = @config.dig('colors', 'progress_info')
-          if color && ParallelMatrixFormatter::Rendering::AnsiColor.respond_to?(color)
-            arr.map { |info| ParallelMatrixFormatter::Rendering::AnsiColor.send(color) { info } }
-          else
-            arr
-          end
-        end
-
         def format_progress_line(progress_info)
-          format_string = @config['progress_line_format'] || "\nUpdate is run from process {process_number}. Progress: {progress_info} "
+          format_string = @config['progress_line_format'] || DEFAULT_LINE_FORMAT
+          # Only build the clock string when the template actually shows it
+          format_string = format_string.gsub('{time}', formatted_time) if format_string.include?('{time}')
           format_string
-            .gsub('{time}', customize_digits(Time.now.strftime("%H:%M:%S"), @config['digits']))
             .gsub('{process_number}', @test_env_number.to_s)
             .gsub('{progress_info}', progress_info)
         end
+
+        def formatted_time
+          customize_digits(Time.now.strftime("%H:%M:%S"), @digits)
+        end
       end
     end
   end
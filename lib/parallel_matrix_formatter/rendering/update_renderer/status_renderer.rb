@@ -1,3 +1,5 @@
+# frozen_string_literal: true
+
 # This class is responsible for rendering the status of individual test examples.
 # It selects appropriate status symbols and applies color formatting based on the test result
 # and configured symbols.
@@ -7,43 +9,53 @@ module ParallelMatrixFormatter
       class StatusRenderer
         include ParallelMatrixFormatter::Rendering::FormatHelper
 
+        COLOR_KEYS = { passed: 'pass_dot', failed: 'fail_dot', pending: 'pending_dot' }.freeze
+        DEFAULT_COLORS = { passed: 'green', failed: 'red', pending: 'yellow' }.freeze
+        DEFAULT_SYMBOLS = { passed: "✅", failed: "❌", pending: "⏳" }.freeze
+        DEFAULT_LINE_FORMAT = "{status_symbol}{process_symbol}"
+        # Process 1 renders as "A", process 2 as "B", and so on
+        PROCESS_SYMBOL_OFFSET = 'A'.ord - 1
+
         def initialize(config)
           @config = config
+          # Configured symbol strings are split into characters once per status
+          @status_chars = Hash.new { |chars, status| chars[status] = status_chars_for(status) }
+          @status_colors = resolve_status_colors
+          @line_format = @config['test_status_line_format'] || DEFAULT_LINE_FORMAT
+          @shows_process_symbol = @line_format.include?('{process_symbol}')
         end
 
         def render(message)
           return "" unless message&.dig('message', 'status')
 
           status = message['message']['status'].to_sym
-          process_symbol = (message['process_number'] - 1 + 'A'.ord).chr
-          status_symbol = get_status_symbol(status)
-          formatted_output = (@config['test_status_line_format'] || "{status_symbol}{process_symbol}")
-            .gsub('{status_symbol}', status_symbol)
-            .gsub('{process_symbol}', process_symbol)
-
-          color = @config.dig('colors', {
-            passed: 'pass_dot',
-            failed: 'fail_dot',
-            pending: 'pending_dot'
-          }[status]) || ({ passed: 'green', failed: 'red', pending: 'yellow' }[status])
-
-          color && AnsiColor.respond_to?(color) ? AnsiColor.send(color) { formatted_output } : formatted_output
+          formatted_output = @line_format.gsub('{status_symbol}', get_status_symbol(status))
+          # Only derive the process letter when the line format shows it
+          if @shows_process_symbol
+            process_symbol = (message['process_number'] + PROCESS_SYMBOL_OFFSET).chr
+            formatted_output = formatted_output.gsub('{process_symbol}', process_symbol)
+          end
+
+          AnsiColor.colorize(@status_colors[status], formatted_output)
         end
 
         private
 
+        # Status colors are fixed for the run, resolve the lookup table once
+        def resolve_status_colors
+          COLOR_KEYS.to_h do |status, key|
+            [status, @config.dig('colors', key) || DEFAULT_COLORS[status]]
+          end.freeze
+        end
+
         def get_status_symbol(status)
+          chars = @status_chars[status]
+          chars ? chars.sample : DEFAULT_SYMBOLS.fetch(status, "")
+        end
+
+        def status_chars_for(status)
           symbols = @config.dig('status_symbols', status.to_s)
-          if symbols.is_a?(String)
-            symbols.each_char.to_a.sample
-          else
-            case status
-            when :passed then "✅"
-            when :failed then "❌"
-            when :pending then "⏳"
-            else ""
-            end
-          end
+          symbols.each_char.to_a.freeze if symbols.is_a?(String)
         end
       end
     end
@@ -24,6 +24,16 @@ RSpec.describe ParallelMatrixFormatter::Config::ProgressColumnParser do
       result = parser.parse_progress_column_percentage(percentage)
       expect(result).to eq({ value: '{v}%', align: '^', width: 8, color: 'red' })
     end
+
+    it 'falls back to defaults when the format has no width' do
+      result = parser.parse_progress_column_percentage({ 'format' => '{v}%' })
+      expect(result).to eq({ value: '{v}%', align: '^', width: 10, color: 'red' })
+    end
+
+    it 'falls back to defaults when the format is missing' do
+      result = parser.parse_progress_column_percentage({ 'color' => 'green' })
+      expect(result).to eq({ value: '{v}%', align: '^', width: 10, color: 'green' })
+    end
   end
 
   describe '.pad_symbol' do
@@ -0,0 +1,60 @@
+# frozen_string_literal: true
+
+require 'spec_helper'
+require 'tempfile'
+
+RSpec.describe ParallelMatrixFormatter::Config do
+  subject(:config) { described_class.new }
+
+  describe '#initialize' do
+    it 'loads the update renderer section' do
+      expect(config.update_renderer).to include('status_symbols')
+    end
+
+    it 'loads the output suppressor section' do
+      expect(config.output_suppressor).to include('suppress')
+    end
+
+    it 'freezes the loaded sections' do
+      expect(config.update_renderer).to be_frozen
+    end
+
+    it 'freezes nested settings' do
+      expect(config.update_renderer['progress_column']['parsed']).to be_frozen
+    end
+
+    it 'reuses the parsed settings across instances' do
+      expect(described_class.new.update_renderer).to equal(config.update_renderer)
+    end
+  end
+
+  describe '.load_settings' do
+    let(:file) { Tempfile.new(['pmf', '.yml']) }
+
+    before do
+      file.write("output_suppressor:\n  suppress: true\n")
+      file.flush
+    end
+
+    after { file.close! }
+
+    it 'returns the cached settings while the file is unchanged' do
+      first = described_class.load_settings(file.path)
+      expect(described_class.load_settings(file.path)).to equal(first)
+    end
+
+    it 'reloads the settings when the file changes' do
+      described_class.load_settings(file.path)
+      File.write(file.path, "output_suppressor:\n  suppress: false\n")
+      expect(described_class.load_settings(file.path)['output_suppressor']['suppress']).to eq(false)
+    end
+  end
+
+  describe '.clear_cache' do
+    it 'forces the next load to parse the file again' do
+      first = described_class.new.update_renderer
+      described_class.clear_cache
+      expect(described_class.new.update_renderer).not_to equal(first)
+    end
+  end
+end
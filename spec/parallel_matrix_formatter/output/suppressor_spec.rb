@@ -30,6 +30,16 @@ RSpec.describe ParallelMatrixFormatter::Output::Suppressor do
       suppressor.suppress
       expect(RSpec::Support.warning_notifier.call('a warning')).to be_nil
     end
+
+    it 'installs the null output once when suppressing from two threads' do
+      # Slow down the install so both threads pass the unlocked sentinel check
+      allow(ParallelMatrixFormatter::Output::NullIO).to receive(:new).and_wrap_original do |original|
+        sleep 0.05
+        original.call
+      end
+      Array.new(2) { Thread.new { described_class.new(config).suppress } }.each(&:join)
+      expect(ParallelMatrixFormatter::Output::NullIO).to have_received(:new).once
+    end
   end
 
   describe '#restore' do
@@ -0,0 +1,29 @@
+# frozen_string_literal: true
+
+require 'spec_helper'
+
+RSpec.describe ParallelMatrixFormatter::Rendering::AnsiColor do
+  describe '.red' do
+    it 'wraps the block result in the color code' do
+      expect(described_class.red { 'x' }).to eq("\e[31mx\e[0m")
+    end
+  end
+
+  describe '.colorize' do
+    it 'wraps the string in the named color' do
+      expect(described_class.colorize('red', 'x')).to eq("\e[31mx\e[0m")
+    end
+
+    it 'accepts symbol color names' do
+      expect(described_class.colorize(:green, 'x')).to eq("\e[32mx\e[0m")
+    end
+
+    it 'returns the string untouched for an unknown color' do
+      expect(described_class.colorize('magenta', 'x')).to eq('x')
+    end
+
+    it 'returns the string untouched when no color is given' do
+      expect(described_class.colorize(nil, 'x')).to eq('x')
+    end
+  end
+end
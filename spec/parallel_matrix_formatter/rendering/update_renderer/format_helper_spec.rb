@@ -0,0 +1,29 @@
+# frozen_string_literal: true
+
+require 'spec_helper'
+
+RSpec.describe ParallelMatrixFormatter::Rendering::FormatHelper do
+  subject(:helper) { Class.new { include ParallelMatrixFormatter::Rendering::FormatHelper }.new }
+
+  describe '#customize_digits' do
+    it 'replaces each digit with its configured symbol' do
+      expect(helper.customize_digits('12:05', { 'symbols' => 'ﾛｲｸﾖﾑﾗﾚﾇﾒﾜ' })).to eq('ｲｸ:ﾛﾗ')
+    end
+
+    it 'does not re-replace symbols that are themselves digits' do
+      expect(helper.customize_digits('0129', { 'symbols' => '1234567890' })).to eq('1230')
+    end
+
+    it 'leaves digits without a configured symbol untouched' do
+      expect(helper.customize_digits('0159', { 'symbols' => 'ab' })).to eq('ab59')
+    end
+
+    it 'treats tr metacharacters in symbols literally' do
+      expect(helper.customize_digits('012', { 'symbols' => 'a-^' })).to eq('a-^')
+    end
+
+    it 'returns the string unchanged without symbols' do
+      expect(helper.customize_digits('12', nil)).to eq('12')
+    end
+  end
+end